@@ -3,6 +3,8 @@ from django.db import models
 from kernel.models import AbstractCentre
 from shell.constants import centres
 
+_CODE_TO_NAME = dict(centres.CENTRES)
+
 
 class Centre(AbstractCentre):
     """
@@ -22,4 +24,4 @@ class Centre(AbstractCentre):
         :return: the name of the centre
         """
 
-        return self.get_code_display()
+        return _CODE_TO_NAME.get(self.code, self.code)
@@ -3,6 +3,8 @@ from django.db import models
 from kernel.models import AbstractDepartment
 from shell.constants import departments
 
+_CODE_TO_NAME = dict(departments.DEPARTMENTS)
+
 
 class Department(AbstractDepartment):
     """
@@ -22,4 +24,4 @@ class Department(AbstractDepartment):
         :return: the name of the department
         """
 
-        return self.get_code_display()
+        return _CODE_TO_NAME.get(self.code, self.code)